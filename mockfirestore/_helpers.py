@@ -1,8 +1,7 @@
-import operator
 import random
 import string
+from functools import lru_cache
 from datetime import datetime as dt
-from functools import reduce
 from typing import (Dict, Any, Tuple, TypeVar, Sequence, Iterator)
 
 T = TypeVar('T')
@@ -12,32 +11,49 @@ Collection = Dict[str, Document]
 Store = Dict[str, Collection]
 
 
-def get_by_path(data: Dict[str, T], path: Sequence[str], create_nested: bool = False) -> T:
-    """Access a nested object in root by item sequence."""
+def _walk(data: Dict[str, Any], path: Sequence[str], stop: int, create: bool = False) -> Any:
+    """Descend through the first `stop` items of path without slicing it."""
+    if create:
+        for i in range(stop):
+            data = data.setdefault(path[i], {})
+    else:
+        for i in range(stop):
+            data = data[path[i]]
+    return data
 
-    def get_or_create(a, b):
-        if b not in a:
-            a[b] = {}
-        return a[b]
 
-    if create_nested:
-        return reduce(get_or_create, path, data)
-    else:
-        return reduce(operator.getitem, path, data)
+def get_by_path(data: Dict[str, T], path: Sequence[str], create_nested: bool = False) -> T:
+    """Access a nested object in root by item sequence."""
+    return _walk(data, path, len(path), create=create_nested)
 
 
 def set_by_path(data: Dict[str, T], path: Sequence[str], value: T, create_nested: bool = True):
     """Set a value in a nested object in root by item sequence."""
-    get_by_path(data, path[:-1], create_nested=True)[path[-1]] = value
+    _walk(data, path, len(path) - 1, create=True)[path[-1]] = value
 
 
 def delete_by_path(data: Dict[str, T], path: Sequence[str]):
     """Delete a value in a nested object in root by item sequence."""
-    del get_by_path(data, path[:-1])[path[-1]]
+    del _walk(data, path, len(path) - 1)[path[-1]]
+
+
+_ID_ALPHABET = string.ascii_letters + string.digits
+_ID_LENGTH = 20
+# Map the first 248 byte values (the largest multiple of 62 that fits in a byte)
+# onto the alphabet and drop the rest, so every character is equally likely.
+_ID_ACCEPTED = len(_ID_ALPHABET) * (256 // len(_ID_ALPHABET))
+_ID_TABLE = bytes.maketrans(bytes(range(_ID_ACCEPTED)),
+                            (_ID_ALPHABET * (256 // len(_ID_ALPHABET))).encode())
+_ID_REJECTED = bytes(range(_ID_ACCEPTED, 256))
 
 
 def generate_random_string():
-    return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(20))
+    chars = b''
+    while len(chars) < _ID_LENGTH:
+        # Draw from the global `random` generator so seeded test suites stay reproducible.
+        chunk = random.getrandbits(8 * _ID_LENGTH).to_bytes(_ID_LENGTH, 'little')
+        chars += chunk.translate(_ID_TABLE, _ID_REJECTED)
+    return chars[:_ID_LENGTH].decode()
 
 
 class Timestamp:
@@ -47,6 +63,9 @@ class Timestamp:
 
     def __init__(self, timestamp: float):
         self._timestamp = timestamp
+        seconds, _, nanos = str(timestamp).partition('.')
+        self._seconds = seconds
+        self._nanos = nanos or '0'
 
     @classmethod
     def from_now(cls):
@@ -55,26 +74,25 @@ class Timestamp:
 
     @property
     def seconds(self):
-        return str(self._timestamp).split('.')[0]
+        return self._seconds
 
     @property
     def nanos(self):
-        return str(self._timestamp).split('.')[1]
+        return self._nanos
 
 
 def get_document_iterator(document: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
     """
     :returns: (dot-delimited path, value,)
     """
-    for key, value in document.items():
-        if isinstance(value, dict):
-            for item in get_document_iterator(value, prefix=key):
-                yield item
-
-        if not prefix:
-            yield key, value
-        else:
-            yield '{}.{}'.format(prefix, key), value
+    stack = [(prefix, document)]
+    while stack:
+        prefix, document = stack.pop()
+        for key, value in document.items():
+            path = prefix + '.' + str(key) if prefix else key
+            if isinstance(value, dict):
+                stack.append((str(path), value))
+            yield path, value
 
 
 # Copyright 2018 Google LLC
@@ -111,68 +129,82 @@ _LEADING_ALPHA_INVALID = re.compile("^[_a-zA-Z][_a-zA-Z0-9]*[^_a-zA-Z0-9]")
 PATH_ELEMENT_TOKENS = [
     ("SIMPLE", r"[_a-zA-Z][_a-zA-Z0-9]*"),  # unquoted elements
     ("QUOTED", r"`(?:\\`|[^`])*?`"),  # quoted elements, unquoted
-    ("DOT", r"\."),  # separator
 ]
-TOKENS_PATTERN = "|".join("(?P<{}>{})".format(*pair) for pair in PATH_ELEMENT_TOKENS)
+# Each match is one element together with its trailing separator, so dots
+# never surface as tokens of their own.
+TOKENS_PATTERN = r"(?:{})(?:\.(?!\Z)|\Z)".format(
+    "|".join("(?P<{}>{})".format(*pair) for pair in PATH_ELEMENT_TOKENS)
+)
 TOKENS_REGEX = re.compile(TOKENS_PATTERN)
+# Elements and dots as separate lexemes, only used to diagnose invalid paths.
+LEXEMES_REGEX = re.compile("|".join(pattern for _, pattern in PATH_ELEMENT_TOKENS) + r"|\.")
+
+
+def _invalid_field_path(path: str) -> ValueError:
+    """Build the error for a path that failed to tokenize.
+
+    Args:
+        path (str): the offending field path.
+    Returns:
+        ValueError: for the first misplaced dot or element, or for the
+                    residue the lexer could not consume.
+    """
+    pos = 0
+    want_dot = False
+    match = LEXEMES_REGEX.match(path)
+    while match is not None:
+        if (match.group() == ".") != want_dot:
+            return ValueError("Invalid path: {}".format(path))
+        want_dot = not want_dot
+        pos = match.end()
+        match = LEXEMES_REGEX.match(path, pos)
+    if pos != len(path):
+        return ValueError("Path {} not consumed, residue: {}".format(path, path[pos:]))
+    return ValueError("Invalid path: {}".format(path))
 
 
 def _tokenize_field_path(path: str):
-    """Lex a field path into tokens (including dots).
+    """Lex a field path into its elements (without dots).
 
     Args:
         path (str): field path to be lexed.
     Returns:
         List(str): tokens
+    Raises:
+        ValueError: if the path is not fully consumed by the lexer, or if
+                    its elements are not separated by single dots.
     """
     pos = 0
-    get_token = TOKENS_REGEX.match
-    match = get_token(path)
-    while match is not None:
-        type_ = match.lastgroup
-        value = match.group(type_)
-        yield value
+    for match in TOKENS_REGEX.finditer(path):
+        if match.start() != pos:
+            break
+        yield match.group(match.lastgroup)
         pos = match.end()
-        match = get_token(path, pos)
     if pos != len(path):
-        raise ValueError("Path {} not consumed, residue: {}".format(path, path[pos:]))
+        raise _invalid_field_path(path)
 
 
+@lru_cache(maxsize=4096)
 def split_field_path(path: str):
     """Split a field path into valid elements (without dots).
 
+    Results are cached, hence returned as an immutable tuple.
+
     Args:
         path (str): field path to be lexed.
     Returns:
-        List(str): tokens
+        Tuple(str): tokens
     Raises:
         ValueError: if the path does not match the elements-interspersed-
                     with-dots pattern.
     """
     if not path:
-        return []
-
-    elements = []
-    want_dot = False
+        return ()
 
-    for element in _tokenize_field_path(path):
-        if want_dot:
-            if element != ".":
-                raise ValueError("Invalid path: {}".format(path))
-            else:
-                want_dot = False
-        else:
-            if element == ".":
-                raise ValueError("Invalid path: {}".format(path))
-            elements.append(element)
-            want_dot = True
-
-    if not want_dot or not elements:
-        raise ValueError("Invalid path: {}".format(path))
-
-    return elements
+    return tuple(_tokenize_field_path(path))
 
 
+@lru_cache(maxsize=4096)
 def parse_field_path(api_repr: str):
     """Parse a **field path** from into a list of nested field names.
 
@@ -187,8 +219,15 @@ def parse_field_path(api_repr: str):
             escaped by surrounding them with backticks.
 
     Returns:
-        List[str, ...]: The list of field names in the field path.
+        Tuple[str, ...]: The field names in the field path. Results are
+        cached, so the tuple is shared between callers.
     """
+    # plain dotted identifiers need no lexing or unescaping
+    if _BACKTICK not in api_repr:
+        field_names = api_repr.split(_FIELD_PATH_DELIMITER)
+        if all(_SIMPLE_FIELD_NAME.fullmatch(field_name) for field_name in field_names):
+            return tuple(field_names)
+
     # code dredged back up from
     # https://github.com/googleapis/google-cloud-python/pull/5109/files
     field_names = []
@@ -199,7 +238,7 @@ def parse_field_path(api_repr: str):
             field_name = field_name.replace(_ESCAPED_BACKTICK, _BACKTICK)
             field_name = field_name.replace(_ESCAPED_BACKSLASH, _BACKSLASH)
         field_names.append(field_name)
-    return field_names
+    return tuple(field_names)
 
 # def parse_field_path(api_repr: str):
 #     return api_repr.replace("`").split(".")
\ No newline at end of file
@@ -2,6 +2,7 @@ from typing import Iterable
 
 from google.cloud.firestore_v1.field_path import render_field_path
 
+from mockfirestore._helpers import parse_field_path, split_field_path
 from mockfirestore.collection import CollectionReference
 from mockfirestore.document import DocumentReference, DocumentSnapshot
 from mockfirestore.transaction import Transaction
@@ -10,17 +11,20 @@ from mockfirestore.transaction import Transaction
 class MockFirestore:
 
     def __init__(self, project: str=None) -> None:
-        self._data = {}
+        # The store is allocated on first use, see `collection`.
+        self._data = None
         self.project = project
 
     def _ensure_path(self, path):
         current_position = self
 
-        for el in path[:-1]:
-            if type(current_position) in (MockFirestore, DocumentReference):
-                current_position = current_position.collection(el)
+        # Segments alternate collection/document starting from the root, so the
+        # segment's parity tells which accessor to call.
+        for i in range(len(path) - 1):
+            if i % 2 == 0:
+                current_position = current_position.collection(path[i])
             else:
-                current_position = current_position.document(el)
+                current_position = current_position.document(path[i])
 
         return current_position
 
@@ -34,27 +38,35 @@ class MockFirestore:
         return current_position.document(path[-1])
 
     def collection(self, path: str) -> CollectionReference:
+        if "/" not in path:
+            if self._data is None:
+                self._data = {}
+            if path not in self._data:
+                self._data[path] = {}
+            return CollectionReference(self._data, [path])
+
         path = path.split("/")
 
         if len(path) % 2 != 1:
             raise Exception("Cannot create collection at path {}".format(path))
 
-        name = path[-1]
-        if len(path) > 1:
-            current_position = self._ensure_path(path)
-            return current_position.collection(name)
-        else:
-            if name not in self._data:
-                self._data[name] = {}
-            return CollectionReference(self._data, [name])
+        current_position = self._ensure_path(path)
+        return current_position.collection(path[-1])
 
     def reset(self):
-        self._data = {}
+        self._data = None
+        parse_field_path.cache_clear()
+        split_field_path.cache_clear()
 
     def get_all(self, references: Iterable[DocumentReference],
                 field_paths=None,
                 transaction=None) -> Iterable[DocumentSnapshot]:
-        for doc_ref in set(references):
+        seen = set()
+        for doc_ref in references:
+            key = (id(doc_ref._data), tuple(doc_ref._path))
+            if key in seen:
+                continue
+            seen.add(key)
             yield doc_ref.get()
 
     def transaction(self, **kwargs) -> Transaction:
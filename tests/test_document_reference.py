@@ -194,6 +194,30 @@ class TestDocumentReference(TestCase):
             'other': {'likes': 1, 'smoked': 'salmon'}
         })
 
+    def test_document_update_transformerIncrementDeeplyNested(self):
+        fs = MockFirestore()
+        fs._data = {'foo': {
+            'first': {
+                'nested': {'deeper': {'count': 1}},
+            }
+        }}
+        fs.collection('foo').document('first').update({
+            'nested': {'deeper': {'count': firestore.Increment(2)}},
+        })
+
+        doc = fs.collection('foo').document('first').get().to_dict()
+        self.assertEqual(doc, {'nested': {'deeper': {'count': 3}}})
+
+    def test_document_update_nonStringNestedKeys(self):
+        fs = MockFirestore()
+        fs._data = {'foo': {
+            'first': {'spicy': 'tuna'}
+        }}
+        fs.collection('foo').document('first').update({'scores': {1: 'a', 2: {3: 'b'}}})
+
+        doc = fs.collection('foo').document('first').get().to_dict()
+        self.assertEqual(doc, {'spicy': 'tuna', 'scores': {1: 'a', 2: {3: 'b'}}})
+
     def test_document_update_transformerIncrementNonExistent(self):
         fs = MockFirestore()
         fs._data = {'foo': {
@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from mockfirestore._helpers import split_field_path, parse_field_path
+
+
+class TestFieldPath(TestCase):
+    def test_split_field_path(self):
+        self.assertEqual(('a', '`b.c`', 'd'), split_field_path('a.`b.c`.d'))
+
+    def test_parse_field_path_unescapesQuotedNames(self):
+        self.assertEqual(('a', 'b.c', 'd'), parse_field_path('a.`b.c`.d'))
+
+    def test_split_field_path_trailingDot(self):
+        with self.assertRaisesRegex(ValueError, r'^Invalid path: a\.$'):
+            split_field_path('a.')
+
+    def test_split_field_path_doubleDot(self):
+        with self.assertRaisesRegex(ValueError, r'^Invalid path: a\.\.b$'):
+            split_field_path('a..b')
+
+    def test_split_field_path_leadingDot(self):
+        with self.assertRaisesRegex(ValueError, r'^Invalid path: \.a$'):
+            split_field_path('.a')
+
+    def test_split_field_path_reportsResidue(self):
+        with self.assertRaisesRegex(ValueError, r'^Path a b not consumed, residue:  b$'):
+            split_field_path('a b')
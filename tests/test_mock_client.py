@@ -16,4 +16,28 @@ class TestMockFirestore(TestCase):
         expected_doc_snapshot = doc.get().to_dict()
         self.assertEqual(returned_doc_snapshot, expected_doc_snapshot)
 
+    def test_client_get_all_dedupes_references(self):
+        fs = MockFirestore()
+        fs._data = {'foo': {
+            'first': {'id': 1},
+            'second': {'id': 2}
+        }}
+        first = fs.collection('foo').document('first')
+        second = fs.collection('foo').document('second')
+        results = list(fs.get_all([first, second, fs.collection('foo').document('first')]))
+        self.assertEqual([doc.to_dict() for doc in results], [{'id': 1}, {'id': 2}])
+
+    def test_client_reset_clears_data(self):
+        fs = MockFirestore()
+        fs.collection('foo').document('first').set({'id': 1})
+        fs.reset()
+        self.assertFalse(fs.collection('foo').document('first').get().exists)
 
+    def test_client_get_all_keeps_references_from_other_clients(self):
+        fs = MockFirestore()
+        fs._data = {'foo': {'first': {'id': 1}}}
+        other_fs = MockFirestore()
+        other_fs._data = {'foo': {'first': {'id': 2}}}
+        results = list(fs.get_all([fs.collection('foo').document('first'),
+                                   other_fs.collection('foo').document('first')]))
+        self.assertEqual([doc.to_dict() for doc in results], [{'id': 1}, {'id': 2}])
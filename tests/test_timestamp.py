@@ -13,3 +13,8 @@ class TestTimestamp(unittest.TestCase):
         self.assertEqual(seconds, timestamp.seconds)
         self.assertEqual(nanos, timestamp.nanos)
 
+    def test_timestamp_wholeNumber(self):
+        timestamp = Timestamp(5)
+
+        self.assertEqual('5', timestamp.seconds)
+        self.assertEqual('0', timestamp.nanos)